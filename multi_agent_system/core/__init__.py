@@ -7,6 +7,7 @@ from .coordinator import (
     MultiAgentCoordinator,
     WorkflowResult,
     RecoveryResult,
+    RollbackPoint,
     get_global_coordinator,
 )
 from .models import (
@@ -42,6 +43,7 @@ __all__ = [
     "MultiAgentCoordinator",
     "WorkflowResult",
     "RecoveryResult",
+    "RollbackPoint",
     "get_global_coordinator",
     # Data models
     "ProjectPlan",
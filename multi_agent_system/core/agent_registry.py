@@ -19,6 +19,9 @@ class AgentRegistry:
         self._agents: Dict[str, BaseMultiAgent] = {}
         self._agent_types: Dict[str, Type[BaseMultiAgent]] = {}
         self._dependencies: Dict[str, List[str]] = {}
+        # Topological order, reset whenever the registered agents change
+        self._execution_order: Optional[List[str]] = None
+        self._execution_levels: Optional[List[List[str]]] = None
 
     def register_agent(
         self, agent: BaseMultiAgent, dependencies: Optional[List[str]] = None
@@ -38,7 +41,9 @@ class AgentRegistry:
 
         self._agents[agent.agent_name] = agent
         self._agent_types[agent.agent_name] = type(agent)
-        self._dependencies[agent.agent_name] = dependencies or []
+        self._dependencies[agent.agent_name] = list(dependencies or [])
+        self._execution_order = None
+        self._execution_levels = None
 
         logger.info(f"Registered agent: {agent.agent_name}")
 
@@ -58,6 +63,8 @@ class AgentRegistry:
         del self._agents[agent_name]
         del self._agent_types[agent_name]
         del self._dependencies[agent_name]
+        self._execution_order = None
+        self._execution_levels = None
 
         logger.info(f"Unregistered agent: {agent_name}")
 
@@ -129,6 +136,8 @@ class AgentRegistry:
         self._agents.clear()
         self._agent_types.clear()
         self._dependencies.clear()
+        self._execution_order = None
+        self._execution_levels = None
         logger.info("All agents cleared from the registry")
 
     def get_agent_info(self, agent_name: str) -> Dict[str, str]:
@@ -153,12 +162,18 @@ class AgentRegistry:
         """
         Get the execution order of agents based on dependencies.
 
+        The order is computed once and reused until agents are registered,
+        unregistered or cleared.
+
         Returns:
             List of agent names in execution order
 
         Raises:
             ValueError: If circular dependencies are detected
         """
+        if self._execution_order is not None:
+            return list(self._execution_order)
+
         # Topological sort to determine execution order
         visited = set()
         temp_visited = set()
@@ -190,7 +205,62 @@ class AgentRegistry:
             if agent_name not in visited:
                 visit(agent_name)
 
-        return result
+        self._execution_order = result
+        return list(result)
+
+    def get_execution_levels(self) -> List[List[str]]:
+        """
+        Get agents grouped into dependency levels.
+
+        Each level only depends on agents in earlier levels, so agents within
+        a level have no dependencies on each other. Like the execution order,
+        the levels are computed once and reused until the registry changes.
+
+        Returns:
+            List of levels, each a list of agent names in registration order
+
+        Raises:
+            ValueError: If circular or missing dependencies are detected
+        """
+        if self._execution_levels is not None:
+            return [list(level) for level in self._execution_levels]
+
+        # Kahn's algorithm, taking the whole zero in-degree frontier per level
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in self._agents}
+        for agent_name in self._agents:
+            deps = self._dependencies.get(agent_name, [])
+            for dep in deps:
+                if dep not in self._agents:
+                    raise ValueError(
+                        f"Dependency {dep} for agent {agent_name} not found"
+                    )
+                dependents[dep].append(agent_name)
+            in_degree[agent_name] = len(deps)
+
+        registration_index = {name: index for index, name in enumerate(self._agents)}
+        levels: List[List[str]] = []
+        frontier = [name for name, degree in in_degree.items() if degree == 0]
+        while frontier:
+            levels.append(frontier)
+            next_frontier = []
+            for agent_name in frontier:
+                for dependent in dependents[agent_name]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_frontier.append(dependent)
+            # Keep each level in registration order, not discovery order
+            frontier = sorted(next_frontier, key=registration_index.__getitem__)
+
+        if sum(len(level) for level in levels) != len(self._agents):
+            placed = {name for level in levels for name in level}
+            cyclic = [name for name in self._agents if name not in placed]
+            raise ValueError(
+                f"Circular dependency detected involving agents {cyclic}"
+            )
+
+        self._execution_levels = levels
+        return [list(level) for level in levels]
 
     def validate_dependencies(self) -> bool:
         """
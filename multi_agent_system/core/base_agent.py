@@ -1,7 +1,11 @@
 """Base agent class for all multi-agent system agents."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, ClassVar, FrozenSet, Optional
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import copy
+import hashlib
+import json
 import logging
 from google.adk.agents import LlmAgent
 from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
@@ -22,6 +26,19 @@ class BaseMultiAgent(LlmAgent, ABC):
     and execution within the coordinated workflow.
     """
 
+    # Agents whose output depends only on their input can opt into caching
+    cacheable: ClassVar[bool] = False
+    # Most recent outputs kept per agent; the least recently used is evicted
+    max_cache_entries: ClassVar[int] = 128
+    # Top-level input keys that change per call without affecting the output
+    volatile_input_keys: ClassVar[FrozenSet[str]] = frozenset({"timestamp"})
+    # Project context keys maintained by the data store, not produced by agents
+    volatile_context_keys: ClassVar[FrozenSet[str]] = frozenset(
+        {"created_at", "updated_at", "workflow_state"}
+    )
+    # Upper bound on execution attempts; None defers to the coordinator
+    max_attempts: ClassVar[Optional[int]] = None
+
     def __init__(
         self,
         name: str,
@@ -63,6 +80,7 @@ class BaseMultiAgent(LlmAgent, ABC):
         # Store agent name and logger separately since LlmAgent is a Pydantic model
         self._agent_name = name
         self._logger = logging.getLogger(f"{__name__}.{name}")
+        self._execute_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
 
     @abstractmethod
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -107,6 +125,70 @@ class BaseMultiAgent(LlmAgent, ABC):
         """
         pass
 
+    def execute_cached(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the agent, reusing earlier output for identical input.
+
+        Only agents with ``cacheable`` set are cached; for all others this
+        simply calls ``execute``. Cached outputs are deep-copied on the way
+        in and out, so callers may freely mutate what they receive. At most
+        ``max_cache_entries`` outputs are kept per agent.
+
+        Args:
+            input_data: Input data from previous agent or user
+
+        Returns:
+            Dict containing the agent's output data
+        """
+        if not self.cacheable:
+            return self.execute(input_data)
+
+        key = self.get_input_fingerprint(input_data)
+        cached_output = self._execute_cache.get(key)
+        if cached_output is not None:
+            self._execute_cache.move_to_end(key)
+            self.logger.debug(f"Reusing cached output for agent {self.agent_name}")
+            return copy.deepcopy(cached_output)
+
+        output = self.execute(input_data)
+        self._execute_cache[key] = copy.deepcopy(output)
+        if len(self._execute_cache) > self.max_cache_entries:
+            self._execute_cache.popitem(last=False)
+        return output
+
+    def get_input_fingerprint(self, input_data: Dict[str, Any]) -> bytes:
+        """
+        Compute a content hash of the input, ignoring volatile keys.
+
+        Volatile keys are dropped only at the top level and from the
+        ``project_context`` bookkeeping, so fields with the same names inside
+        agent data still count towards the fingerprint.
+
+        Args:
+            input_data: Input data to fingerprint
+
+        Returns:
+            16-byte BLAKE2b digest of the canonical JSON form of the input
+        """
+        stable_input = {
+            key: value
+            for key, value in input_data.items()
+            if key not in self.volatile_input_keys
+        }
+        project_context = stable_input.get("project_context")
+        if isinstance(project_context, dict):
+            stable_input["project_context"] = {
+                key: value
+                for key, value in project_context.items()
+                if key not in self.volatile_context_keys
+            }
+        payload = json.dumps(stable_input, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    def clear_execute_cache(self) -> None:
+        """Discard all cached execution outputs."""
+        self._execute_cache.clear()
+
     @property
     def agent_name(self) -> str:
         """Get the agent name."""
@@ -1,8 +1,14 @@
 """Multi-agent workflow coordination and orchestration."""
 
+import asyncio
+import copy
+import re
+import time
 import uuid
 import logging
-from typing import Dict, Any, List, Optional, Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable, Generator, Tuple
 from datetime import datetime
 
 from .base_agent import BaseMultiAgent, AgentExecutionError
@@ -12,6 +18,117 @@ from .models import WorkflowState, WorkflowStatus
 
 logger = logging.getLogger(__name__)
 
+# Expected output type for each known agent
+AGENT_OUTPUT_TYPES = {
+    "ProjectPlanningAgent": "project_plan",
+    "ModuleDesignAgent": "module_structure",
+    "TestPlanningAgent": "test_plan",
+    "CodeImplementationAgent": "code_artifact",
+    "TestingAgent": "test_results",
+    "CodeRefinementAgent": "code_artifact",
+}
+
+# Agents whose failure aborts the whole workflow
+WORKFLOW_CRITICAL_AGENTS = frozenset({"ProjectPlanningAgent", "ModuleDesignAgent"})
+
+# Agents that cannot be skipped during recovery
+NON_SKIPPABLE_AGENTS = frozenset(
+    {
+        "ProjectPlanningAgent",
+        "ModuleDesignAgent",
+        "CodeImplementationAgent",
+    }
+)
+
+# Non-critical agents that can be skipped during recovery
+OPTIONAL_AGENTS = frozenset(
+    {
+        "CodeRefinementAgent",  # Can skip if initial code is acceptable
+        "TestingAgent",  # Can skip if manual testing is acceptable (not recommended)
+    }
+)
+
+# Error message fragments that indicate a transient, retryable failure
+TRANSIENT_ERROR_INDICATORS = (
+    "timeout",
+    "connection",
+    "network",
+    "temporary",
+    "temporarily",
+    "rate limit",
+    "service unavailable",
+    "unavailable",
+    "too many requests",
+    "quota exceeded",
+)
+
+# Single alternation so classification is one scan of the message
+_TRANSIENT_ERROR_PATTERN = re.compile(
+    "|".join(re.escape(indicator) for indicator in TRANSIENT_ERROR_INDICATORS),
+    re.IGNORECASE,
+)
+
+# Suggestions offered with every user intervention request
+GENERAL_USER_SUGGESTIONS = (
+    "Review the error message and agent logs for more details",
+    "Check if the input data format is correct",
+)
+
+# Agent-specific suggestions for user intervention requests
+AGENT_USER_SUGGESTIONS: Dict[str, Tuple[str, ...]] = {
+    "ProjectPlanningAgent": (
+        "Verify the project description is clear and detailed",
+        "Check if the requested technology stack is supported",
+        "Consider simplifying the project scope",
+    ),
+    "ModuleDesignAgent": (
+        "Review the project plan for completeness",
+        "Check if the architecture requirements are feasible",
+        "Consider breaking down complex modules",
+    ),
+    "CodeImplementationAgent": (
+        "Verify the module design is complete and valid",
+        "Check if all required dependencies are available",
+        "Review test plans for implementation guidance",
+    ),
+}
+
+# Error message keywords mapped to a suggestion, checked in order
+ERROR_USER_SUGGESTIONS: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("timeout",), "Consider increasing timeout limits or simplifying the task"),
+    (
+        ("memory", "resource"),
+        "Try reducing the scope or complexity of the current task",
+    ),
+    (("permission", "access"), "Check file system permissions and access rights"),
+)
+
+
+@lru_cache(maxsize=256)
+def _build_suggested_user_actions(
+    agent_name: str, error_message: str
+) -> Tuple[str, ...]:
+    """
+    Build the suggested user actions for an agent failure.
+
+    Cached because retried agents tend to fail with the same message.
+
+    Args:
+        agent_name: Name of the failed agent
+        error_message: Lower-cased error message
+
+    Returns:
+        Tuple of suggested actions for the user
+    """
+    suggestions = GENERAL_USER_SUGGESTIONS + AGENT_USER_SUGGESTIONS.get(agent_name, ())
+
+    # Error-specific suggestion, first matching rule wins
+    for keywords, suggestion in ERROR_USER_SUGGESTIONS:
+        if any(keyword in error_message for keyword in keywords):
+            return suggestions + (suggestion,)
+
+    return suggestions
+
 
 class WorkflowResult:
     """Result of workflow execution."""
@@ -52,6 +169,27 @@ class WorkflowResult:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class RollbackPoint:
+    """Immutable snapshot of workflow progress taken before an agent runs."""
+
+    agent_name: str
+    created_at: datetime
+    completed_agents: Tuple[str, ...]
+    failed_agents: Tuple[str, ...]
+    current_agent: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary representation."""
+        return {
+            "agent_name": self.agent_name,
+            "timestamp": self.created_at.isoformat(),
+            "completed_agents": list(self.completed_agents),
+            "failed_agents": list(self.failed_agents),
+            "current_agent": self.current_agent,
+        }
+
+
 class MultiAgentCoordinator:
     """
     Coordinator for multi-agent workflow orchestration.
@@ -100,6 +238,33 @@ class MultiAgentCoordinator:
         self.registry.register_agent(agent, dependencies)
         logger.info(f"Registered agent {agent.agent_name} with coordinator")
 
+    def register_agents(
+        self, agents: List[Tuple[BaseMultiAgent, Optional[List[str]]]]
+    ) -> None:
+        """
+        Register several agents with the coordinator in one call.
+
+        Dependencies may refer to agents later in the list; the dependency
+        graph is only resolved when the workflow is validated or executed.
+
+        Registration is all-or-nothing: every name is checked before any
+        agent is registered.
+
+        Args:
+            agents: List of (agent instance, dependency names) pairs
+
+        Raises:
+            ValueError: If a name is already registered or repeated in the list
+        """
+        registered = set(self.registry.list_agents())
+        for agent, _ in agents:
+            if agent.agent_name in registered:
+                raise ValueError(f"Agent {agent.agent_name} is already registered")
+            registered.add(agent.agent_name)
+
+        for agent, dependencies in agents:
+            self.register_agent(agent, dependencies)
+
     def add_progress_callback(self, callback: Callable[[WorkflowState], None]) -> None:
         """
         Add a callback function to be called on workflow progress updates.
@@ -109,6 +274,24 @@ class MultiAgentCoordinator:
         """
         self._progress_callbacks.append(callback)
 
+    def remove_progress_callback(
+        self, callback: Callable[[WorkflowState], None]
+    ) -> bool:
+        """
+        Remove a previously added progress callback.
+
+        Args:
+            callback: Callback function to remove
+
+        Returns:
+            True if the callback was removed, False if it was not registered
+        """
+        try:
+            self._progress_callbacks.remove(callback)
+        except ValueError:
+            return False
+        return True
+
     def execute_workflow(
         self, initial_input: str, workflow_id: Optional[str] = None
     ) -> WorkflowResult:
@@ -125,6 +308,80 @@ class MultiAgentCoordinator:
         Raises:
             ValueError: If no agents are registered or dependencies are invalid
         """
+        # Outputs are only copied for streaming callers, so nothing is yielded
+        run = self._run_workflow(initial_input, workflow_id, stream_outputs=False)
+        while True:
+            try:
+                next(run)
+            except StopIteration as stop:
+                return stop.value
+
+    async def execute_workflow_async(
+        self, initial_input: str, workflow_id: Optional[str] = None
+    ) -> WorkflowResult:
+        """
+        Execute the workflow without blocking the running event loop.
+
+        Agents still run one at a time in dependency order; the workflow is
+        executed on a worker thread so async callers can await it. Progress
+        callbacks are therefore invoked on that worker thread, not on the
+        event loop.
+
+        Running several workflows concurrently on one coordinator is not
+        supported: they would share ``_current_workflow`` and the data store.
+        Await one call before starting the next, or use one coordinator per
+        concurrent workflow.
+
+        Args:
+            initial_input: Initial input for the workflow (project description)
+            workflow_id: Optional workflow ID (generates one if None)
+
+        Returns:
+            WorkflowResult containing execution details
+        """
+        return await asyncio.to_thread(
+            self.execute_workflow, initial_input, workflow_id
+        )
+
+    def execute_workflow_stream(
+        self, initial_input: str, workflow_id: Optional[str] = None
+    ) -> Generator[Tuple[str, Dict[str, Any]], None, WorkflowResult]:
+        """
+        Execute the workflow, yielding each agent's output as soon as it completes.
+
+        Args:
+            initial_input: Initial input for the workflow (project description)
+            workflow_id: Optional workflow ID (generates one if None)
+
+        Yields:
+            Tuples of (agent_name, copy of the stored output data) for each
+            completed agent. Closing the generator early cancels the workflow.
+
+        Returns:
+            WorkflowResult containing execution details (as the generator's
+            return value)
+        """
+        return (
+            yield from self._run_workflow(
+                initial_input, workflow_id, stream_outputs=True
+            )
+        )
+
+    def _run_workflow(
+        self, initial_input: str, workflow_id: Optional[str], stream_outputs: bool
+    ) -> Generator[Tuple[str, Dict[str, Any]], None, WorkflowResult]:
+        """
+        Run the workflow, optionally yielding a copy of each agent's output.
+
+        Args:
+            initial_input: Initial input for the workflow (project description)
+            workflow_id: Optional workflow ID (generates one if None)
+            stream_outputs: Whether to yield (agent_name, output copy) pairs
+
+        Returns:
+            WorkflowResult containing execution details (as the generator's
+            return value)
+        """
         # Generate workflow ID if not provided
         if workflow_id is None:
             workflow_id = str(uuid.uuid4())
@@ -132,6 +389,7 @@ class MultiAgentCoordinator:
         # Initialize workflow result
         result = WorkflowResult(workflow_id, success=False)
         result.start_time = datetime.now()
+        closed = False
 
         try:
             # Validate agent dependencies
@@ -171,9 +429,12 @@ class MultiAgentCoordinator:
                         result.add_completed_agent(agent_name)
                         logger.info(f"Agent {agent_name} completed successfully")
                     else:
+                        attempts = self._get_max_attempts(
+                            self.registry.get_agent(agent_name)
+                        )
                         workflow_state.mark_agent_failed(
                             agent_name,
-                            f"Agent {agent_name} failed after {self.max_retries} retries",
+                            f"Agent {agent_name} failed after {attempts} attempts",
                         )
                         result.add_failed_agent(agent_name)
                         logger.error(f"Agent {agent_name} failed after maximum retries")
@@ -197,6 +458,15 @@ class MultiAgentCoordinator:
                 self.data_store.update_workflow_state(workflow_state)
                 self._notify_progress_callbacks(workflow_state)
 
+                # Hand the completed agent's output to the caller right away
+                if stream_outputs and agent_name in result.completed_agents:
+                    latest_output = self.data_store.get_latest_agent_output(
+                        agent_name
+                    )
+                    yield agent_name, (
+                        copy.deepcopy(latest_output.data) if latest_output else {}
+                    )
+
             # Mark workflow as completed
             workflow_state.status = WorkflowStatus.COMPLETED
             workflow_state.end_time = datetime.now()
@@ -204,6 +474,12 @@ class MultiAgentCoordinator:
 
             logger.info(f"Workflow {workflow_id} completed successfully")
 
+        except GeneratorExit:
+            # The consumer stopped iterating; the result is never returned
+            closed = True
+            self.cancel_workflow()
+            raise
+
         except Exception as e:
             # Mark workflow as failed
             if self._current_workflow:
@@ -217,17 +493,19 @@ class MultiAgentCoordinator:
             logger.error(f"Workflow {workflow_id} failed: {e}")
 
         finally:
-            # Calculate execution time
-            result.end_time = datetime.now()
-            if result.start_time:
-                result.execution_time = (
-                    result.end_time - result.start_time
-                ).total_seconds()
-
-            # Update final workflow state
-            if self._current_workflow:
-                self.data_store.update_workflow_state(self._current_workflow)
-                self._notify_progress_callbacks(self._current_workflow)
+            # A closed stream was already cancelled and reported
+            if not closed:
+                # Calculate execution time
+                result.end_time = datetime.now()
+                if result.start_time:
+                    result.execution_time = (
+                        result.end_time - result.start_time
+                    ).total_seconds()
+
+                # Update final workflow state
+                if self._current_workflow:
+                    self.data_store.update_workflow_state(self._current_workflow)
+                    self._notify_progress_callbacks(self._current_workflow)
 
             self._current_workflow = None
 
@@ -248,8 +526,9 @@ class MultiAgentCoordinator:
         """
         agent = self.registry.get_agent(agent_name)
         retry_count = 0
+        max_retries = self._get_max_attempts(agent) - 1
 
-        while retry_count <= self.max_retries:
+        while retry_count <= max_retries:
             try:
                 # Update workflow state
                 workflow_state.current_agent = agent_name
@@ -257,7 +536,7 @@ class MultiAgentCoordinator:
                 self._notify_progress_callbacks(workflow_state)
 
                 logger.info(
-                    f"Executing agent {agent_name} (attempt {retry_count + 1}/{self.max_retries + 1})"
+                    f"Executing agent {agent_name} (attempt {retry_count + 1}/{max_retries + 1})"
                 )
 
                 # Get input data for the agent
@@ -269,7 +548,7 @@ class MultiAgentCoordinator:
 
                 # Execute the agent
                 agent.log_execution_start(input_data)
-                output = agent.execute(input_data)
+                output = agent.execute_cached(input_data)
                 agent.log_execution_end(output)
 
                 # Format and store output
@@ -294,16 +573,14 @@ class MultiAgentCoordinator:
                 retry_count += 1
                 agent.log_error(e, f"Execution attempt {retry_count}")
 
-                if retry_count <= self.max_retries:
+                if retry_count <= max_retries:
                     logger.warning(
                         f"Agent {agent_name} failed (attempt {retry_count}), retrying in {self.retry_delay}s: {e}"
                     )
-                    import time
-
                     time.sleep(self.retry_delay)
                 else:
                     logger.error(
-                        f"Agent {agent_name} failed after {self.max_retries + 1} attempts: {e}"
+                        f"Agent {agent_name} failed after {max_retries + 1} attempts: {e}"
                     )
                     # Call handle_agent_failure for recovery mechanisms
                     self.handle_agent_failure(agent_name, e)
@@ -311,6 +588,24 @@ class MultiAgentCoordinator:
 
         return False
 
+    def _get_max_attempts(self, agent: BaseMultiAgent) -> int:
+        """
+        Get how many times an agent is executed before it counts as failed.
+
+        Agents that fail deterministically can cap their own attempts below
+        the coordinator's retry budget.
+
+        Args:
+            agent: Agent to be executed
+
+        Returns:
+            Effective number of execution attempts (at least one)
+        """
+        attempts = self.max_retries + 1
+        if agent.max_attempts is not None:
+            attempts = min(attempts, max(agent.max_attempts, 1))
+        return attempts
+
     def _get_output_type_for_agent(self, agent_name: str) -> str:
         """
         Get the expected output type for an agent.
@@ -321,17 +616,7 @@ class MultiAgentCoordinator:
         Returns:
             Expected output type string
         """
-        # Map agent names to their expected output types
-        output_type_mapping = {
-            "ProjectPlanningAgent": "project_plan",
-            "ModuleDesignAgent": "module_structure",
-            "TestPlanningAgent": "test_plan",
-            "CodeImplementationAgent": "code_artifact",
-            "TestingAgent": "test_results",
-            "CodeRefinementAgent": "code_artifact",
-        }
-
-        return output_type_mapping.get(agent_name, "generic_output")
+        return AGENT_OUTPUT_TYPES.get(agent_name, "generic_output")
 
     def _should_abort_workflow(
         self, failed_agent: str, workflow_state: WorkflowState
@@ -346,11 +631,8 @@ class MultiAgentCoordinator:
         Returns:
             True if workflow should be aborted
         """
-        # Critical agents that should abort the workflow if they fail
-        critical_agents = {"ProjectPlanningAgent", "ModuleDesignAgent"}
-
         # Abort if critical agent fails
-        if failed_agent in critical_agents:
+        if failed_agent in WORKFLOW_CRITICAL_AGENTS:
             return True
 
         # Abort if too many agents have failed
@@ -370,7 +652,8 @@ class MultiAgentCoordinator:
         Args:
             workflow_state: Current workflow state
         """
-        for callback in self._progress_callbacks:
+        # Iterate over a snapshot so callbacks may remove themselves
+        for callback in tuple(self._progress_callbacks):
             try:
                 callback(workflow_state)
             except Exception as e:
@@ -384,15 +667,19 @@ class MultiAgentCoordinator:
             agent_name: Name of the failed agent
             error: Exception that caused the failure
         """
-        logger.error(f"Handling failure for agent {agent_name}: {error}")
+        # Stringify the error once for the whole recovery path
+        error_text = str(error)
+        logger.error(f"Handling failure for agent {agent_name}: {error_text}")
 
         if self._current_workflow:
-            self._current_workflow.mark_agent_failed(agent_name, str(error))
+            self._current_workflow.mark_agent_failed(agent_name, error_text)
             self.data_store.update_workflow_state(self._current_workflow)
             self._notify_progress_callbacks(self._current_workflow)
 
         # Trigger recovery mechanisms
-        recovery_result = self._attempt_recovery(agent_name, error)
+        recovery_result = self._attempt_recovery(
+            agent_name, error, error_text=error_text
+        )
 
         if not recovery_result.success:
             logger.error(
@@ -400,7 +687,9 @@ class MultiAgentCoordinator:
             )
             # Check if user intervention is needed
             if recovery_result.requires_user_intervention:
-                self._request_user_intervention(agent_name, error, recovery_result)
+                self._request_user_intervention(
+                    agent_name, error, recovery_result, error_text=error_text
+                )
 
     def get_workflow_progress(self) -> Optional[Dict[str, Any]]:
         """
@@ -457,6 +746,16 @@ class MultiAgentCoordinator:
         """
         return self.registry.get_execution_order()
 
+    def get_agent_execution_levels(self) -> List[List[str]]:
+        """
+        Get registered agents grouped into dependency levels.
+
+        Returns:
+            List of levels, each a list of agent names with no dependencies
+            on one another
+        """
+        return self.registry.get_execution_levels()
+
     def validate_workflow_setup(self) -> Dict[str, Any]:
         """
         Validate the current workflow setup.
@@ -509,21 +808,28 @@ class MultiAgentCoordinator:
 
         return validation_result
 
-    def _attempt_recovery(self, agent_name: str, error: Exception) -> "RecoveryResult":
+    def _attempt_recovery(
+        self, agent_name: str, error: Exception, error_text: Optional[str] = None
+    ) -> "RecoveryResult":
         """
         Attempt to recover from agent failure using various strategies.
 
         Args:
             agent_name: Name of the failed agent
             error: Exception that caused the failure
+            error_text: Precomputed ``str(error)``; computed here if omitted
 
         Returns:
             RecoveryResult indicating success/failure and next steps
         """
         logger.info(f"Attempting recovery for failed agent {agent_name}")
 
+        if error_text is None:
+            error_text = str(error)
+        lowered_error = error_text.lower()
+
         # Strategy 1: Check if this is a transient error that can be retried
-        if self._is_transient_error(error):
+        if self._is_transient_error(error, error_text=error_text):
             logger.info(
                 f"Detected transient error for {agent_name}, will be handled by retry mechanism"
             )
@@ -534,7 +840,9 @@ class MultiAgentCoordinator:
             )
 
         # Strategy 2: Try alternative execution approach
-        alternative_result = self._try_alternative_approach(agent_name, error)
+        alternative_result = self._try_alternative_approach(
+            agent_name, error, lowered_error=lowered_error
+        )
         if alternative_result.success:
             return alternative_result
 
@@ -552,7 +860,7 @@ class MultiAgentCoordinator:
                     strategy="rollback_with_intervention",
                     message=f"Rollback succeeded but critical agent {agent_name} still requires user intervention",
                     requires_user_intervention=True,
-                    error_details=str(error),
+                    error_details=error_text,
                 )
             return rollback_result
 
@@ -576,39 +884,28 @@ class MultiAgentCoordinator:
             strategy="user_intervention",
             message="All automated recovery strategies failed",
             requires_user_intervention=True,
-            error_details=str(error),
+            error_details=error_text,
         )
 
-    def _is_transient_error(self, error: Exception) -> bool:
+    def _is_transient_error(
+        self, error: Exception, error_text: Optional[str] = None
+    ) -> bool:
         """
         Determine if an error is transient and likely to succeed on retry.
 
         Args:
             error: Exception to analyze
+            error_text: Precomputed ``str(error)``; computed here if omitted
 
         Returns:
             True if error appears to be transient
         """
-        transient_error_indicators = [
-            "timeout",
-            "connection",
-            "network",
-            "temporary",
-            "temporarily",
-            "rate limit",
-            "service unavailable",
-            "unavailable",
-            "too many requests",
-            "quota exceeded",
-        ]
-
-        error_message = str(error).lower()
-        return any(
-            indicator in error_message for indicator in transient_error_indicators
-        )
+        if error_text is None:
+            error_text = str(error)
+        return _TRANSIENT_ERROR_PATTERN.search(error_text) is not None
 
     def _try_alternative_approach(
-        self, agent_name: str, error: Exception
+        self, agent_name: str, error: Exception, lowered_error: Optional[str] = None
     ) -> "RecoveryResult":
         """
         Try an alternative execution approach for the failed agent.
@@ -616,6 +913,7 @@ class MultiAgentCoordinator:
         Args:
             agent_name: Name of the failed agent
             error: Original error
+            lowered_error: Precomputed ``str(error).lower()``; computed if omitted
 
         Returns:
             RecoveryResult indicating success/failure
@@ -626,7 +924,9 @@ class MultiAgentCoordinator:
         # Could include: different model parameters, alternative prompts, etc.
 
         # Example: Try with reduced complexity or different parameters
-        if "complexity" in str(error).lower() or "too complex" in str(error).lower():
+        if lowered_error is None:
+            lowered_error = str(error).lower()
+        if "complexity" in lowered_error or "too complex" in lowered_error:
             logger.info(f"Attempting simplified approach for {agent_name}")
             # This would require agent-specific logic to reduce complexity
             return RecoveryResult(
@@ -698,29 +998,16 @@ class MultiAgentCoordinator:
         Returns:
             True if agent can be safely skipped
         """
-        # Define non-critical agents that can be skipped
-        optional_agents = {
-            "CodeRefinementAgent",  # Can skip if initial code is acceptable
-            "TestingAgent",  # Can skip if manual testing is acceptable (not recommended)
-        }
-
-        # Critical agents that cannot be skipped
-        critical_agents = {
-            "ProjectPlanningAgent",
-            "ModuleDesignAgent",
-            "CodeImplementationAgent",
-        }
-
-        if agent_name in critical_agents:
+        if agent_name in NON_SKIPPABLE_AGENTS:
             return False
 
-        if agent_name in optional_agents:
+        if agent_name in OPTIONAL_AGENTS:
             return True
 
         # For unknown agents, be conservative and don't skip
         return False
 
-    def _create_rollback_point(self, agent_name: str) -> Dict[str, Any]:
+    def _create_rollback_point(self, agent_name: str) -> Optional[RollbackPoint]:
         """
         Create a rollback point before agent execution.
 
@@ -728,60 +1015,50 @@ class MultiAgentCoordinator:
             agent_name: Name of the agent about to execute
 
         Returns:
-            Dictionary containing rollback state information
+            RollbackPoint snapshot of the workflow state, or None if no active workflow
         """
         if not self._current_workflow:
-            return {}
+            return None
 
-        rollback_point = {
-            "timestamp": datetime.now().isoformat(),
-            "agent_name": agent_name,
-            "workflow_state": self._current_workflow.model_dump()
-            if self._current_workflow
-            else None,
-            "project_context": self.data_store.get_project_context().model_dump(),
-            "completed_agents": self._current_workflow.completed_agents.copy()
-            if self._current_workflow
-            else [],
-            "failed_agents": self._current_workflow.failed_agents.copy()
-            if self._current_workflow
-            else [],
-        }
+        rollback_point = RollbackPoint(
+            agent_name=agent_name,
+            created_at=datetime.now(),
+            completed_agents=tuple(self._current_workflow.completed_agents),
+            failed_agents=tuple(self._current_workflow.failed_agents),
+            current_agent=self._current_workflow.current_agent,
+        )
 
         # Store rollback point in data store for persistence
         self.data_store.store_agent_output(
             agent_name="system",
             output_type="rollback_point",
-            data=rollback_point,
+            data=rollback_point.to_dict(),
             metadata={"created_for_agent": agent_name},
         )
 
         return rollback_point
 
-    def _restore_to_rollback_point(self, rollback_point: Dict[str, Any]) -> None:
+    def _restore_to_rollback_point(
+        self, rollback_point: Optional[RollbackPoint]
+    ) -> None:
         """
         Restore system state to a previous rollback point.
 
         Args:
-            rollback_point: Rollback point data
+            rollback_point: Rollback point snapshot
         """
         if not rollback_point:
             raise ValueError("Invalid rollback point")
 
         logger.info(
-            f"Restoring to rollback point created at {rollback_point.get('timestamp')}"
+            f"Restoring to rollback point created at {rollback_point.created_at.isoformat()}"
         )
 
-        # Restore workflow state
-        if rollback_point.get("workflow_state") and self._current_workflow:
-            workflow_data = rollback_point["workflow_state"]
-            self._current_workflow.completed_agents = workflow_data.get(
-                "completed_agents", []
-            )
-            self._current_workflow.failed_agents = workflow_data.get(
-                "failed_agents", []
-            )
-            self._current_workflow.current_agent = workflow_data.get("current_agent")
+        # Restore workflow state in place so existing list references stay valid
+        if self._current_workflow:
+            self._current_workflow.completed_agents[:] = rollback_point.completed_agents
+            self._current_workflow.failed_agents[:] = rollback_point.failed_agents
+            self._current_workflow.current_agent = rollback_point.current_agent
 
         # Note: Project context restoration would require more sophisticated
         # state management and could be implemented based on specific needs
@@ -801,7 +1078,11 @@ class MultiAgentCoordinator:
         # TODO: Implement actual output clearing in data store
 
     def _request_user_intervention(
-        self, agent_name: str, error: Exception, recovery_result: "RecoveryResult"
+        self,
+        agent_name: str,
+        error: Exception,
+        recovery_result: "RecoveryResult",
+        error_text: Optional[str] = None,
     ) -> None:
         """
         Request user intervention for unrecoverable errors.
@@ -810,19 +1091,25 @@ class MultiAgentCoordinator:
             agent_name: Name of the failed agent
             error: Original error
             recovery_result: Result of recovery attempts
+            error_text: Precomputed ``str(error)``; computed here if omitted
         """
         logger.critical(f"User intervention required for agent {agent_name}")
 
+        if error_text is None:
+            error_text = str(error)
+
         intervention_request = {
             "timestamp": datetime.now().isoformat(),
             "agent_name": agent_name,
-            "error_message": str(error),
+            "error_message": error_text,
             "recovery_attempts": recovery_result.strategy,
             "recovery_message": recovery_result.message,
             "workflow_id": self._current_workflow.workflow_id
             if self._current_workflow
             else None,
-            "suggested_actions": self._get_suggested_user_actions(agent_name, error),
+            "suggested_actions": self._get_suggested_user_actions(
+                agent_name, error, lowered_error=error_text.lower()
+            ),
         }
 
         # Store intervention request
@@ -837,14 +1124,14 @@ class MultiAgentCoordinator:
         if self._current_workflow:
             self._current_workflow.status = WorkflowStatus.FAILED
             self._current_workflow.error_message = (
-                f"User intervention required for agent {agent_name}: {error}"
+                f"User intervention required for agent {agent_name}: {error_text}"
             )
             self._notify_progress_callbacks(self._current_workflow)
 
         logger.info(f"User intervention request created for agent {agent_name}")
 
     def _get_suggested_user_actions(
-        self, agent_name: str, error: Exception
+        self, agent_name: str, error: Exception, lowered_error: Optional[str] = None
     ) -> List[str]:
         """
         Get suggested actions for user intervention.
@@ -852,56 +1139,14 @@ class MultiAgentCoordinator:
         Args:
             agent_name: Name of the failed agent
             error: Original error
+            lowered_error: Precomputed ``str(error).lower()``; computed if omitted
 
         Returns:
             List of suggested actions for the user
         """
-        suggestions = []
-        error_message = str(error).lower()
-
-        # General suggestions
-        suggestions.append("Review the error message and agent logs for more details")
-        suggestions.append("Check if the input data format is correct")
-
-        # Agent-specific suggestions
-        if agent_name == "ProjectPlanningAgent":
-            suggestions.extend(
-                [
-                    "Verify the project description is clear and detailed",
-                    "Check if the requested technology stack is supported",
-                    "Consider simplifying the project scope",
-                ]
-            )
-        elif agent_name == "ModuleDesignAgent":
-            suggestions.extend(
-                [
-                    "Review the project plan for completeness",
-                    "Check if the architecture requirements are feasible",
-                    "Consider breaking down complex modules",
-                ]
-            )
-        elif agent_name == "CodeImplementationAgent":
-            suggestions.extend(
-                [
-                    "Verify the module design is complete and valid",
-                    "Check if all required dependencies are available",
-                    "Review test plans for implementation guidance",
-                ]
-            )
-
-        # Error-specific suggestions
-        if "timeout" in error_message:
-            suggestions.append(
-                "Consider increasing timeout limits or simplifying the task"
-            )
-        elif "memory" in error_message or "resource" in error_message:
-            suggestions.append(
-                "Try reducing the scope or complexity of the current task"
-            )
-        elif "permission" in error_message or "access" in error_message:
-            suggestions.append("Check file system permissions and access rights")
-
-        return suggestions
+        if lowered_error is None:
+            lowered_error = str(error).lower()
+        return list(_build_suggested_user_actions(agent_name, lowered_error))
 
     def get_user_intervention_requests(self) -> List[Dict[str, Any]]:
         """
@@ -1000,22 +1245,15 @@ class MultiAgentCoordinator:
         return True
 
 
+@dataclass(slots=True)
 class RecoveryResult:
     """Result of a recovery attempt."""
 
-    def __init__(
-        self,
-        success: bool,
-        strategy: str,
-        message: str,
-        requires_user_intervention: bool = False,
-        error_details: Optional[str] = None,
-    ):
-        self.success = success
-        self.strategy = strategy
-        self.message = message
-        self.requires_user_intervention = requires_user_intervention
-        self.error_details = error_details
+    success: bool
+    strategy: str
+    message: str
+    requires_user_intervention: bool = False
+    error_details: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation."""
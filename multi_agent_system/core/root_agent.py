@@ -1,13 +1,15 @@
 """Root agent implementation for the multi-agent system."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from google.adk.agents import LlmAgent
 from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
 from dotenv import load_dotenv
+from datetime import datetime
+from pydantic import Field
 import logging
 
 from .base_agent import BaseMultiAgent, AgentExecutionError, ValidationError
-from .coordinator import MultiAgentCoordinator
+from .coordinator import MultiAgentCoordinator, WorkflowResult
 from .agent_registry import get_global_registry, AgentRegistry
 from .data_store import get_global_data_store, SharedDataStore
 
@@ -17,6 +19,10 @@ load_dotenv()
 GEMINI_MODEL = "gemini-2.5-flash"
 logger = logging.getLogger(__name__)
 
+# Static workflow summary recommendations
+TEST_RESULTS_RECOMMENDATION = "Review test results and ensure all tests pass"
+CODE_REVIEW_RECOMMENDATION = "Conduct code review before deployment"
+
 
 class RootAgent(BaseMultiAgent):
     """
@@ -27,12 +33,22 @@ class RootAgent(BaseMultiAgent):
     """
 
     # Pydantic model fields
-    coordinator: MultiAgentCoordinator = {"default_factory": MultiAgentCoordinator}
-    registry: AgentRegistry = {"default_factory": get_global_registry}
-    data_store: SharedDataStore = {"default_factory": get_global_data_store}
+    coordinator: MultiAgentCoordinator = Field(default_factory=MultiAgentCoordinator)
+    registry: AgentRegistry = Field(default_factory=get_global_registry)
+    data_store: SharedDataStore = Field(default_factory=get_global_data_store)
 
     def __init__(self, **data):
-        """Initialize the root agent."""
+        """
+        Initialize the root agent.
+
+        A ``coordinator`` may be passed in; the registry and data store then
+        default to the coordinator's own so deliverables are collected from
+        the store the workflow writes to.
+        """
+        coordinator = data.pop("coordinator", None)
+        registry = data.pop("registry", None)
+        data_store = data.pop("data_store", None)
+
         # Set default values for the RootAgent
         data.setdefault("name", "RootAgent")
         data.setdefault(
@@ -83,6 +99,15 @@ are properly executed and integrated.
         )
         super().__init__(**data)
 
+        if coordinator is not None:
+            self.coordinator = coordinator
+            registry = registry or coordinator.registry
+            data_store = data_store or coordinator.data_store
+        if registry is not None:
+            self.registry = registry
+        if data_store is not None:
+            self.data_store = data_store
+
         logger.info("RootAgent initialized successfully")
 
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -98,51 +123,111 @@ are properly executed and integrated.
         try:
             self.log_execution_start(input_data)
 
-            # Extract project description
-            project_description = input_data.get("description", "")
-            workflow_id = input_data.get("workflow_id")
+            project_description, workflow_id = self._prepare_workflow(input_data)
+            result = self.coordinator.execute_workflow(project_description, workflow_id)
 
-            if not project_description:
-                raise ValidationError(
-                    self.agent_name, "description", "Project description is required"
-                )
+            output = self._build_workflow_output(result)
 
-            # Validate workflow setup
-            validation_result = self.coordinator.validate_workflow_setup()
-            if not validation_result["valid"]:
-                raise AgentExecutionError(
-                    self.agent_name,
-                    f"Workflow validation failed: {validation_result['errors']}",
-                )
+            self.log_execution_end(output)
+            return output
+
+        except Exception as e:
+            self.log_error(e, "Workflow execution failed")
+            raise AgentExecutionError(self.agent_name, str(e), e)
+
+    def execute_stream(self, input_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the workflow, yielding partial deliverables as agents complete.
+
+        Args:
+            input_data: Dictionary containing project description and configuration
 
-            # Execute the workflow
-            self.logger.info(
-                f"Starting workflow execution for project: {project_description[:100]}..."
+        Yields:
+            A ``{"stage": agent_name, "partial": output}`` entry for each completed
+            agent, followed by a ``{"stage": "final", ...}`` entry carrying the
+            same fields returned by ``execute``
+        """
+        try:
+            self.log_execution_start(input_data)
+
+            project_description, workflow_id = self._prepare_workflow(input_data)
+            stream = self.coordinator.execute_workflow_stream(
+                project_description, workflow_id
             )
-            result = self.coordinator.execute_workflow(project_description, workflow_id)
 
-            # Collect deliverables
-            deliverables = self._collect_deliverables(result.workflow_id)
-
-            # Format final output
-            output = {
-                "success": result.success,
-                "workflow_id": result.workflow_id,
-                "completed_agents": result.completed_agents,
-                "failed_agents": result.failed_agents,
-                "execution_time": result.execution_time,
-                "error_message": result.error_message,
-                "deliverables": deliverables,
-                "summary": self._generate_workflow_summary(result, deliverables),
-            }
+            while True:
+                try:
+                    agent_name, partial_output = next(stream)
+                except StopIteration as stop:
+                    result = stop.value
+                    break
+                yield {"stage": agent_name, "partial": partial_output}
+
+            output = self._build_workflow_output(result)
 
             self.log_execution_end(output)
-            return output
+            yield {"stage": "final", **output}
 
         except Exception as e:
             self.log_error(e, "Workflow execution failed")
             raise AgentExecutionError(self.agent_name, str(e), e)
 
+    def _prepare_workflow(self, input_data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+        """
+        Extract workflow parameters and validate the coordinator setup.
+
+        Args:
+            input_data: Dictionary containing project description and configuration
+
+        Returns:
+            Tuple of (project description, optional workflow ID)
+        """
+        # Extract project description
+        project_description = input_data.get("description", "")
+        workflow_id = input_data.get("workflow_id")
+
+        if not project_description:
+            raise ValidationError(
+                self.agent_name, "description", "Project description is required"
+            )
+
+        # Validate workflow setup
+        validation_result = self.coordinator.validate_workflow_setup()
+        if not validation_result["valid"]:
+            raise AgentExecutionError(
+                self.agent_name,
+                f"Workflow validation failed: {validation_result['errors']}",
+            )
+
+        self.logger.info(
+            f"Starting workflow execution for project: {project_description[:100]}..."
+        )
+        return project_description, workflow_id
+
+    def _build_workflow_output(self, result: WorkflowResult) -> Dict[str, Any]:
+        """
+        Build the final output dictionary for a finished workflow.
+
+        Args:
+            result: Workflow execution result
+
+        Returns:
+            Dictionary containing workflow results and deliverables
+        """
+        # Collect deliverables
+        deliverables = self._collect_deliverables(result.workflow_id)
+
+        return {
+            "success": result.success,
+            "workflow_id": result.workflow_id,
+            "completed_agents": result.completed_agents,
+            "failed_agents": result.failed_agents,
+            "execution_time": result.execution_time,
+            "error_message": result.error_message,
+            "deliverables": deliverables,
+            "summary": self._generate_workflow_summary(result, deliverables),
+        }
+
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
         Validate input data for the root agent.
@@ -202,7 +287,7 @@ are properly executed and integrated.
         return {
             "result": result,
             "agent": self.agent_name,
-            "timestamp": self.data_store.get_current_timestamp(),
+            "timestamp": datetime.now().isoformat(),
         }
 
     def get_workflow_progress(self) -> Optional[Dict[str, Any]]:
@@ -271,16 +356,19 @@ are properly executed and integrated.
         Returns:
             Dictionary containing workflow summary
         """
+        completed_count = len(result.completed_agents)
+        failed_count = len(result.failed_agents)
+
         summary = {
             "status": "completed" if result.success else "failed",
-            "total_agents": len(result.completed_agents) + len(result.failed_agents),
-            "successful_agents": len(result.completed_agents),
-            "failed_agents": len(result.failed_agents),
+            "total_agents": completed_count + failed_count,
+            "successful_agents": completed_count,
+            "failed_agents": failed_count,
             "execution_time_seconds": result.execution_time,
-            "deliverables_count": len(
-                [d for d in deliverables.values() if d is not None]
+            "deliverables_count": sum(
+                1 for d in deliverables.values() if d is not None
             ),
-            "key_deliverables": list(deliverables.keys()),
+            "key_deliverables": list(deliverables),
         }
 
         # Add recommendations based on results
@@ -292,12 +380,14 @@ are properly executed and integrated.
             )
 
         if "test_results" in deliverables:
-            recommendations.append("Review test results and ensure all tests pass")
+            recommendations.append(TEST_RESULTS_RECOMMENDATION)
 
         if "code_artifacts" in deliverables:
-            recommendations.append("Conduct code review before deployment")
+            recommendations.append(CODE_REVIEW_RECOMMENDATION)
 
-        summary["recommendations"] = recommendations
+        # Only attach recommendations when at least one applies
+        if recommendations:
+            summary["recommendations"] = recommendations
 
         return summary
 
@@ -0,0 +1,208 @@
+"""Mock agents shared across the test modules."""
+
+import functools
+import logging
+import pickle
+from typing import Callable, Dict, Any, TypeVar
+
+from multi_agent_system.core import AgentExecutionError, BaseMultiAgent
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def clone_mock_data(data: T) -> T:
+    """Return an independent copy of static mock data (pickle beats deepcopy)."""
+    return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+
+def static_mock_data(build: Callable[[], T]) -> Callable[[], T]:
+    """Run a mock data builder once and return a fresh copy on every call."""
+    build_once = functools.cache(build)
+
+    @functools.wraps(build)
+    def clone() -> T:
+        return clone_mock_data(build_once())
+
+    return clone
+
+
+# Static mock outputs; agents return copies made with clone_mock_data
+MOCK_PROJECT_PLAN = {
+    "project_name": "Test Project",
+    "description": "A test project for workflow orchestration",
+    "project_type": "general_application",
+    "requirements": [
+        {
+            "id": "FR001",
+            "type": "functional",
+            "description": "Requirement 1",
+            "priority": "high",
+            "category": "core_functionality"
+        },
+        {
+            "id": "FR002",
+            "type": "functional",
+            "description": "Requirement 2",
+            "priority": "medium",
+            "category": "enhancement"
+        }
+    ],
+    "technology_stack": {
+        "primary_language": "python",
+        "frameworks": ["pytest", "pydantic"],
+        "databases": ["sqlite"],
+        "tools": ["git"],
+        "justification": "Chosen for simplicity and testing capabilities"
+    },
+    "estimated_timeline_days": 10,
+    "target_users": ["developers"],
+    "complexity_assessment": {
+        "score": 3,
+        "level": "low",
+        "effort_estimate_days": 10
+    },
+    "scope_definition": {
+        "in_scope": {
+            "core_features": ["Requirement 1", "Requirement 2"]
+        },
+        "nice_to_have": {},
+        "out_of_scope": {},
+        "assumptions": ["Development will follow agile methodology"],
+        "constraints": []
+    },
+    "key_assumptions": ["Development will follow agile methodology"],
+    "success_criteria": ["All core functional requirements are implemented"],
+    "risks_and_mitigation": []
+}
+
+MOCK_MODULE_STRUCTURE = {
+    "modules": [
+        {
+            "name": "core",
+            "purpose": "Core functionality",
+            "public_interface": ["main_function"],
+            "dependencies": [],
+            "estimated_complexity": 5,
+            "file_path": "src/core.py",
+        },
+        {
+            "name": "utils",
+            "purpose": "Utility functions",
+            "public_interface": ["helper_function"],
+            "dependencies": [],
+            "estimated_complexity": 3,
+            "file_path": "src/utils.py",
+        },
+    ],
+    "interfaces": [
+        {
+            "name": "CoreInterface",
+            "methods": ["main_function"],
+            "properties": [],
+            "description": "Core interface",
+        }
+    ],
+    "dependencies": {"core": [], "utils": []},
+    "architecture_pattern": "layered",
+}
+
+
+class MockProjectPlanningAgent(BaseMultiAgent):
+    """Mock project planning agent for testing."""
+
+    # Output is static, so repeated runs can reuse it
+    cacheable = True
+
+    def __init__(self):
+        super().__init__(
+            name="ProjectPlanningAgent",
+            description="Mock agent for project planning",
+            instruction="Create a project plan from user input",
+        )
+
+    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute project planning."""
+        logger.info("Executing ProjectPlanningAgent")
+
+        return {"project_plan": clone_mock_data(MOCK_PROJECT_PLAN)}
+
+    def validate_input(self, input_data: Dict[str, Any]) -> bool:
+        """Validate input data."""
+        # Accept coordinator input as well as a direct description
+        return isinstance(input_data, dict) and (
+            "project_context" in input_data or "description" in input_data
+        )
+
+    def format_output(self, result: Any) -> Dict[str, Any]:
+        """Format output."""
+        # For project planning agent, return just the project plan data
+        # when storing in the data store
+        if isinstance(result, dict) and "project_plan" in result:
+            return result["project_plan"]
+        return result
+
+
+class MockModuleDesignAgent(BaseMultiAgent):
+    """Mock module design agent for testing."""
+
+    # Output is static, so repeated runs can reuse it
+    cacheable = True
+
+    def __init__(self):
+        super().__init__(
+            name="ModuleDesignAgent",
+            description="Mock agent for module design",
+            instruction="Create module structure from project plan",
+        )
+
+    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute module design."""
+        logger.info("Executing ModuleDesignAgent")
+
+        return {"module_structure": clone_mock_data(MOCK_MODULE_STRUCTURE)}
+
+    def validate_input(self, input_data: Dict[str, Any]) -> bool:
+        """Validate input data."""
+        # Check if project_plan is in input_data or if we can get it from data store
+        if "project_plan" in input_data:
+            return True
+        # In a real implementation, we would check the data store here
+        return True  # For testing, allow execution to proceed
+
+    def format_output(self, result: Any) -> Dict[str, Any]:
+        """Format output."""
+        # For module design agent, return just the module structure data
+        # when storing in the data store
+        if isinstance(result, dict) and "module_structure" in result:
+            return result["module_structure"]
+        return result
+
+
+class FailureAgent(BaseMultiAgent):
+    """Mock agent that always fails with a configured error message."""
+
+    # The failure is deterministic, so retrying only adds delay
+    max_attempts = 1
+
+    def __init__(
+        self, name: str, description: str, instruction: str, error_message: str
+    ):
+        super().__init__(
+            name=name,
+            description=description,
+            instruction=instruction,
+        )
+        self._error_message = error_message
+
+    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute and fail with the configured error."""
+        logger.info("Executing %s - simulating failure", self.agent_name)
+        raise AgentExecutionError(self.agent_name, self._error_message)
+
+    def validate_input(self, input_data: Dict[str, Any]) -> bool:
+        return True
+
+    def format_output(self, result: Any) -> Dict[str, Any]:
+        return result
@@ -0,0 +1,30 @@
+"""Shared pytest configuration for the test suite."""
+
+import logging
+import os
+
+import pytest
+
+from multi_agent_system.core import MultiAgentCoordinator
+from multi_agent_system.core.agent_registry import AgentRegistry
+from multi_agent_system.core.data_store import SharedDataStore
+
+
+def pytest_configure(config):
+    """Configure logging once per test session (once per xdist worker)."""
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "WARNING").upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+@pytest.fixture(scope="session")
+def make_coordinator():
+    """Factory for coordinators with their own registry and data store."""
+
+    def _make_coordinator(**kwargs) -> MultiAgentCoordinator:
+        return MultiAgentCoordinator(
+            registry=AgentRegistry(), data_store=SharedDataStore(), **kwargs
+        )
+
+    return _make_coordinator
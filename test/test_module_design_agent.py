@@ -1,15 +1,12 @@
 """Test script for the Module Design Agent."""
 
-import sys
-import os
-import pytest
-
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Any, Dict
 
 from multi_agent_system.core.base_agent import BaseMultiAgent
 from multi_agent_system.core.models import ModuleStructure, Module, Interface
 
+from _mocks import static_mock_data
+
 
 class MockProjectPlanningAgent(BaseMultiAgent):
     """Mock project planning agent for testing."""
@@ -49,6 +46,62 @@ class MockProjectPlanningAgent(BaseMultiAgent):
         return result
 
 
+@static_mock_data
+def mock_structure_dump() -> Dict[str, Any]:
+    """Dumped mock module structure."""
+    # Create mock modules
+    mock_modules = [
+        Module.model_construct(
+            name="auth_module",
+            purpose="Authentication and authorization",
+            public_interface=["authenticate", "authorize"],
+            dependencies=[],
+            estimated_complexity=3,
+            file_path="src/auth/auth_module.py"
+        ),
+        Module.model_construct(
+            name="task_module",
+            purpose="Task management functionality",
+            public_interface=["create_task", "update_task", "delete_task"],
+            dependencies=["auth_module"],
+            estimated_complexity=5,
+            file_path="src/tasks/task_module.py"
+        )
+    ]
+
+    # Create mock interfaces
+    mock_interfaces = [
+        Interface.model_construct(
+            name="AuthInterface",
+            methods=["authenticate", "authorize"],
+            properties=["current_user"],
+            description="Authentication interface"
+        ),
+        Interface.model_construct(
+            name="TaskInterface",
+            methods=["create_task", "update_task", "delete_task"],
+            properties=[],
+            description="Task management interface"
+        )
+    ]
+
+    # Create mock dependencies
+    mock_dependencies = {
+        "auth_module": [],
+        "task_module": ["auth_module"]
+    }
+
+    # Create mock module structure
+    mock_module_structure = ModuleStructure.model_construct(
+        modules=mock_modules,
+        interfaces=mock_interfaces,
+        dependencies=mock_dependencies,
+        architecture_pattern="Layered Architecture"
+    )
+
+    return mock_module_structure.model_dump()
+
+
 class MockModuleDesignAgent(BaseMultiAgent):
     """Mock module design agent for testing."""
 
@@ -65,58 +118,8 @@ class MockModuleDesignAgent(BaseMultiAgent):
         if not self.validate_input(input_data):
             raise ValueError("Invalid input data")
 
-        # Create mock modules
-        mock_modules = [
-            Module(
-                name="auth_module",
-                purpose="Authentication and authorization",
-                public_interface=["authenticate", "authorize"],
-                dependencies=[],
-                estimated_complexity=3,
-                file_path="src/auth/auth_module.py"
-            ),
-            Module(
-                name="task_module",
-                purpose="Task management functionality",
-                public_interface=["create_task", "update_task", "delete_task"],
-                dependencies=["auth_module"],
-                estimated_complexity=5,
-                file_path="src/tasks/task_module.py"
-            )
-        ]
-        
-        # Create mock interfaces
-        mock_interfaces = [
-            Interface(
-                name="AuthInterface",
-                methods=["authenticate", "authorize"],
-                properties=["current_user"],
-                description="Authentication interface"
-            ),
-            Interface(
-                name="TaskInterface",
-                methods=["create_task", "update_task", "delete_task"],
-                properties=[],
-                description="Task management interface"
-            )
-        ]
-        
-        # Create mock dependencies
-        mock_dependencies = {
-            "auth_module": [],
-            "task_module": ["auth_module"]
-        }
-        
-        # Create mock module structure
-        mock_module_structure = ModuleStructure(
-            modules=mock_modules,
-            interfaces=mock_interfaces,
-            dependencies=mock_dependencies,
-            architecture_pattern="Layered Architecture"
-        )
-        
         return {
-            "module_structure": mock_module_structure.model_dump(),
+            "module_structure": mock_structure_dump(),
             "design_analysis": {"project_type": "web_application"},
             "architecture_pattern": "Layered Architecture",
             "validation_result": {"is_valid": True, "errors": [], "warnings": []},
@@ -194,3 +197,14 @@ def test_module_design_agent_format_output():
     mock_result = {"test": "data"}
     formatted = agent.format_output(mock_result)
     assert formatted == mock_result
+
+
+def test_module_design_agent_output_is_valid_structure():
+    """Test that the mock module structure passes full model validation."""
+    agent = MockModuleDesignAgent()
+
+    result = agent.execute({"project_plan": {"project_name": "Test"}})
+
+    module_structure = ModuleStructure.model_validate(result["module_structure"])
+    assert module_structure.validate_dependencies()
+    assert len(module_structure.modules) == 2
@@ -1,19 +1,73 @@
 """Test script for the Project Planning Agent."""
 
-import sys
-import os
-import pytest
-
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from typing import Any, Dict
 
 from multi_agent_system.core.base_agent import BaseMultiAgent
-from multi_agent_system.core.models import ProjectPlan, TechnologyStack, ProjectRequirement
+from multi_agent_system.core.models import (
+    ProjectPlan,
+    TechnologyStack,
+    ProjectRequirement,
+    RequirementPriority,
+    RequirementType,
+)
+
+from _mocks import static_mock_data
+
+
+@static_mock_data
+def mock_plan_dumps() -> Dict[str, Dict[str, Any]]:
+    """Dumped mock project plan and technology stack."""
+    mock_requirements = [
+        ProjectRequirement.model_construct(
+            id="FR001",
+            type=RequirementType.FUNCTIONAL,
+            description="User authentication system",
+            priority=RequirementPriority.HIGH,
+            category="security"
+        ),
+        ProjectRequirement.model_construct(
+            id="FR002",
+            type=RequirementType.FUNCTIONAL,
+            description="Task management functionality",
+            priority=RequirementPriority.HIGH,
+            category="core"
+        )
+    ]
+
+    mock_tech_stack = TechnologyStack.model_construct(
+        primary_language="Python",
+        frameworks=["FastAPI", "Pydantic"],
+        databases=["PostgreSQL"],
+        tools=["Docker", "Git"],
+        justification="Modern stack for web applications"
+    )
+
+    mock_project_plan = ProjectPlan.model_construct(
+        project_name="Task Management System",
+        description="A web application for task management",
+        project_type="web_application",
+        target_users=["end users", "team members"],
+        requirements=mock_requirements,
+        technology_stack=mock_tech_stack,
+        complexity_assessment={"level": "medium", "score": 6, "effort_estimate_days": 30},
+        scope_definition={"in_scope": {}, "out_of_scope": {}},
+        estimated_timeline_days=30,
+        key_assumptions=[],
+        success_criteria=[],
+        risks_and_mitigation=[]
+    )
+
+    return {
+        "project_plan": mock_project_plan.model_dump(),
+        "technology_recommendations": mock_tech_stack.model_dump(),
+    }
 
 
 class MockProjectPlanningAgent(BaseMultiAgent):
     """Mock project planning agent for testing."""
 
+    cacheable = True
+
     def __init__(self):
         super().__init__(
             name="ProjectPlanningAgent",
@@ -27,52 +81,12 @@ class MockProjectPlanningAgent(BaseMultiAgent):
         if not self.validate_input(input_data):
             raise ValueError("Invalid input data")
 
-        # Return mock project plan
-        mock_requirements = [
-            ProjectRequirement(
-                id="FR001",
-                type="functional",
-                description="User authentication system",
-                priority="high",
-                category="security"
-            ),
-            ProjectRequirement(
-                id="FR002",
-                type="functional",
-                description="Task management functionality",
-                priority="high",
-                category="core"
-            )
-        ]
-        
-        mock_tech_stack = TechnologyStack(
-            primary_language="Python",
-            frameworks=["FastAPI", "Pydantic"],
-            databases=["PostgreSQL"],
-            tools=["Docker", "Git"],
-            justification="Modern stack for web applications"
-        )
-        
-        mock_project_plan = ProjectPlan(
-            project_name="Task Management System",
-            description="A web application for task management",
-            project_type="web_application",
-            target_users=["end users", "team members"],
-            requirements=mock_requirements,
-            technology_stack=mock_tech_stack,
-            complexity_assessment={"level": "medium", "score": 6, "effort_estimate_days": 30},
-            scope_definition={"in_scope": {}, "out_of_scope": {}},
-            estimated_timeline_days=30,
-            key_assumptions=[],
-            success_criteria=[],
-            risks_and_mitigation=[]
-        )
-        
+        dumps = mock_plan_dumps()
         return {
-            "project_plan": mock_project_plan.model_dump(),
+            "project_plan": dumps["project_plan"],
             "analysis_summary": {"project_type": "web_application"},
             "complexity_assessment": {"level": "medium", "score": 6},
-            "technology_recommendations": mock_tech_stack.model_dump(),
+            "technology_recommendations": dumps["technology_recommendations"],
             "scope_definition": {},
         }
 
@@ -137,3 +151,71 @@ def test_project_planning_agent_format_output():
     mock_result = {"test": "data"}
     formatted = agent.format_output(mock_result)
     assert formatted == mock_result
+
+
+def test_project_planning_agent_output_is_valid_plan():
+    """Test that the mock project plan passes full model validation."""
+    agent = MockProjectPlanningAgent()
+
+    result = agent.execute({"description": "Test project"})
+
+    project_plan = ProjectPlan.model_validate(result["project_plan"])
+    assert project_plan.project_name == "Task Management System"
+    assert len(project_plan.requirements) == 2
+
+
+def test_project_planning_agent_cached_execution():
+    """Test that repeated identical input reuses the cached output."""
+    agent = MockProjectPlanningAgent()
+
+    first = agent.execute_cached({"description": "Test project", "timestamp": "t1"})
+    second = agent.execute_cached({"description": "Test project", "timestamp": "t2"})
+
+    # Timestamps are volatile, so both calls share one cache entry
+    assert first == second
+    assert first is not second
+    assert len(agent._execute_cache) == 1
+
+    agent.execute_cached({"description": "Another project"})
+    assert len(agent._execute_cache) == 2
+
+    agent.clear_execute_cache()
+    assert len(agent._execute_cache) == 0
+
+
+def test_project_planning_agent_cache_fingerprint():
+    """Test that only data store bookkeeping is ignored when fingerprinting."""
+    agent = MockProjectPlanningAgent()
+
+    def make_input(context_time, plan_time):
+        return {
+            "description": "Test project",
+            "project_context": {
+                "created_at": context_time,
+                "workflow_state": {"workflow_id": context_time},
+                "project_plan": {"created_at": plan_time},
+            },
+        }
+
+    fingerprint = agent.get_input_fingerprint(make_input("t1", "p1"))
+    assert agent.get_input_fingerprint(make_input("t2", "p1")) == fingerprint
+    # Nested agent data with a volatile-looking name is still significant
+    assert agent.get_input_fingerprint(make_input("t1", "p2")) != fingerprint
+
+
+def test_project_planning_agent_cache_eviction(monkeypatch):
+    """Test that the execute cache evicts the least recently used output."""
+    monkeypatch.setattr(MockProjectPlanningAgent, "max_cache_entries", 2)
+    agent = MockProjectPlanningAgent()
+
+    first = agent.get_input_fingerprint({"description": "first"})
+    agent.execute_cached({"description": "first"})
+    agent.execute_cached({"description": "second"})
+    agent.execute_cached({"description": "first"})  # refresh "first"
+    agent.execute_cached({"description": "third"})
+
+    assert len(agent._execute_cache) == 2
+    assert first in agent._execute_cache
+    assert agent.get_input_fingerprint({"description": "second"}) not in (
+        agent._execute_cache
+    )
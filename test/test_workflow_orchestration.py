@@ -1,179 +1,27 @@
 #!/usr/bin/env python3
 """Test script for workflow orchestration functionality."""
 
-import sys
 import logging
-from typing import Dict, Any
 
-# Add the project root to Python path
-sys.path.insert(0, ".")
+import pytest
 
-from multi_agent_system.core import (
-    BaseMultiAgent,
-    MultiAgentCoordinator,
-    get_global_registry,
-    get_global_data_store,
-)
+from multi_agent_system.core import AgentExecutionError, MultiAgentCoordinator
+from multi_agent_system.core.agent_registry import AgentRegistry
+from multi_agent_system.core.models import WorkflowStatus
+from multi_agent_system.core.root_agent import RootAgent
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+from _mocks import (
+    MOCK_PROJECT_PLAN,
+    FailureAgent,
+    MockModuleDesignAgent,
+    MockProjectPlanningAgent,
 )
-logger = logging.getLogger(__name__)
-
-
-class MockProjectPlanningAgent(BaseMultiAgent):
-    """Mock project planning agent for testing."""
-
-    def __init__(self):
-        super().__init__(
-            name="ProjectPlanningAgent",
-            description="Mock agent for project planning",
-            instruction="Create a project plan from user input",
-        )
-
-    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute project planning."""
-        logger.info("Executing ProjectPlanningAgent")
-
-        # Create properly structured project plan data
-        project_plan = {
-            "project_name": "Test Project",
-            "description": "A test project for workflow orchestration",
-            "project_type": "general_application",
-            "requirements": [
-                {
-                    "id": "FR001",
-                    "type": "functional",
-                    "description": "Requirement 1",
-                    "priority": "high",
-                    "category": "core_functionality"
-                },
-                {
-                    "id": "FR002",
-                    "type": "functional",
-                    "description": "Requirement 2",
-                    "priority": "medium",
-                    "category": "enhancement"
-                }
-            ],
-            "technology_stack": {
-                "primary_language": "python",
-                "frameworks": ["pytest", "pydantic"],
-                "databases": ["sqlite"],
-                "tools": ["git"],
-                "justification": "Chosen for simplicity and testing capabilities"
-            },
-            "estimated_timeline_days": 10,
-            "target_users": ["developers"],
-            "complexity_assessment": {
-                "score": 3,
-                "level": "low",
-                "effort_estimate_days": 10
-            },
-            "scope_definition": {
-                "in_scope": {
-                    "core_features": ["Requirement 1", "Requirement 2"]
-                },
-                "nice_to_have": {},
-                "out_of_scope": {},
-                "assumptions": ["Development will follow agile methodology"],
-                "constraints": []
-            },
-            "key_assumptions": ["Development will follow agile methodology"],
-            "success_criteria": ["All core functional requirements are implemented"],
-            "risks_and_mitigation": []
-        }
-
-        return {"project_plan": project_plan}
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """Validate input data."""
-        return "project_context" in input_data
-
-    def format_output(self, result: Any) -> Dict[str, Any]:
-        """Format output."""
-        # For project planning agent, return just the project plan data
-        # when storing in the data store
-        if isinstance(result, dict) and "project_plan" in result:
-            return result["project_plan"]
-        return result
-
-
-class MockModuleDesignAgent(BaseMultiAgent):
-    """Mock module design agent for testing."""
-
-    def __init__(self):
-        super().__init__(
-            name="ModuleDesignAgent",
-            description="Mock agent for module design",
-            instruction="Create module structure from project plan",
-        )
 
-    def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute module design."""
-        logger.info("Executing ModuleDesignAgent")
-
-        # Simulate module design logic
-        module_structure = {
-            "modules": [
-                {
-                    "name": "core",
-                    "purpose": "Core functionality",
-                    "public_interface": ["main_function"],
-                    "dependencies": [],
-                    "estimated_complexity": 5,
-                    "file_path": "src/core.py",
-                },
-                {
-                    "name": "utils",
-                    "purpose": "Utility functions",
-                    "public_interface": ["helper_function"],
-                    "dependencies": [],
-                    "estimated_complexity": 3,
-                    "file_path": "src/utils.py",
-                },
-            ],
-            "interfaces": [
-                {
-                    "name": "CoreInterface",
-                    "methods": ["main_function"],
-                    "properties": [],
-                    "description": "Core interface",
-                }
-            ],
-            "dependencies": {"core": [], "utils": []},
-            "architecture_pattern": "layered",
-        }
-
-        return {"module_structure": module_structure}
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """Validate input data."""
-        # Check if project_plan is in input_data or if we can get it from data store
-        if "project_plan" in input_data:
-            return True
-        # In a real implementation, we would check the data store here
-        return True  # For testing, allow execution to proceed
-
-    def format_output(self, result: Any) -> Dict[str, Any]:
-        """Format output."""
-        # For module design agent, return just the module structure data
-        # when storing in the data store
-        if isinstance(result, dict) and "module_structure" in result:
-            return result["module_structure"]
-        return result
+logger = logging.getLogger(__name__)
 
 
 def setup_workflow(coordinator: MultiAgentCoordinator):
     """Helper function to register agents for tests."""
-    registry = get_global_registry()
-    data_store = get_global_data_store()
-
-    # Clear any existing data
-    data_store.clear_data()
-    registry.clear_agents()
-
     # Create mock agents
     planning_agent = MockProjectPlanningAgent()
     design_agent = MockModuleDesignAgent()
@@ -181,82 +29,312 @@ def setup_workflow(coordinator: MultiAgentCoordinator):
     # Register agents with dependencies
     coordinator.register_agent(planning_agent, dependencies=[])
     coordinator.register_agent(design_agent, dependencies=["ProjectPlanningAgent"])
-    logger.info(f"Registered agents: {registry.list_agents()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Registered agents: %s", coordinator.registry.list_agents())
 
 
-def test_workflow_orchestration():
+@pytest.fixture(scope="module")
+def executed_workflow(make_coordinator):
+    """Execute the mock workflow once and share its outcome across tests."""
+    total_agents = 2
+    progress_updates = []
+    completed_agents = []
+
+    def progress_callback(workflow_state):
+        """Callback to capture progress updates."""
+        # Record only agents completed since the previous update
+        newly_completed = workflow_state.completed_agents[len(completed_agents):]
+        completed_agents.extend(newly_completed)
+        progress_info = {
+            "status": workflow_state.status,
+            "current_agent": workflow_state.current_agent,
+            "newly_completed_agents": newly_completed,
+            "progress_percentage": workflow_state.get_progress_percentage(
+                total_agents
+            ),
+        }
+        progress_updates.append(progress_info)
+        logger.debug("Progress update: %s", progress_info)
+
+    # Use a new coordinator for this module to ensure isolation
+    coordinator = make_coordinator()
+    setup_workflow(coordinator)
+    coordinator.add_progress_callback(progress_callback)
+
+    # Execute workflow
+    logger.info("Starting workflow execution")
+    result = coordinator.execute_workflow(
+        "Create a simple Python project with core and utility modules"
+    )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Workflow result: %s", result.to_dict())
+
+    return {
+        "coordinator": coordinator,
+        "result": result,
+        "project_context": coordinator.data_store.get_project_context(),
+        "progress_updates": progress_updates,
+        "completed_agents": completed_agents,
+    }
+
+
+def test_workflow_orchestration(executed_workflow):
     """Test the workflow orchestration functionality."""
     logger.info("Starting workflow orchestration test")
 
-    # Use a new coordinator for this test to ensure isolation
-    coordinator = MultiAgentCoordinator()
-    setup_workflow(coordinator)
+    coordinator = executed_workflow["coordinator"]
 
     # Validate workflow setup
     validation_result = coordinator.validate_workflow_setup()
-    logger.info(f"Workflow validation: {validation_result}")
+    logger.info("Workflow validation: %s", validation_result)
     assert validation_result["valid"], (
         f"Workflow validation failed: {validation_result['errors']}"
     )
 
     # Test execution order
     execution_order = coordinator.get_agent_execution_order()
-    logger.info(f"Execution order: {execution_order}")
+    logger.info("Execution order: %s", execution_order)
     assert execution_order == ["ProjectPlanningAgent", "ModuleDesignAgent"]
 
-    # Execute workflow
-    logger.info("Starting workflow execution")
-    result = coordinator.execute_workflow(
-        "Create a simple Python project with core and utility modules"
-    )
-
-    logger.info(f"Workflow result: {result.to_dict()}")
+    execution_levels = coordinator.get_agent_execution_levels()
+    logger.info("Execution levels: %s", execution_levels)
+    assert execution_levels == [["ProjectPlanningAgent"], ["ModuleDesignAgent"]]
 
     # Check results
+    result = executed_workflow["result"]
     assert result.success, f"Workflow failed: {result.error_message}"
     logger.info("Workflow executed successfully!")
 
     # Verify data was stored correctly
-    data_store = coordinator.data_store
-    project_context = data_store.get_project_context()
-    assert project_context.project_plan is not None, "Project plan was not created"
-    assert project_context.module_structure is not None, (
-        "Module structure was not created"
-    )
+    project_context = executed_workflow["project_context"]
+    project_plan = project_context.project_plan
+    module_structure = project_context.module_structure
+    assert project_plan is not None, "Project plan was not created"
+    assert module_structure is not None, "Module structure was not created"
 
-    logger.info(f"Project name: {project_context.project_plan.project_name}")
-    logger.info(f"Number of modules: {len(project_context.module_structure.modules)}")
+    logger.info("Project name: %s", project_plan.project_name)
+    logger.info("Number of modules: %d", len(module_structure.modules))
 
 
-def test_progress_monitoring():
+def test_progress_monitoring(executed_workflow):
     """Test workflow progress monitoring."""
     logger.info("Testing progress monitoring")
 
-    progress_updates = []
+    progress_updates = executed_workflow["progress_updates"]
 
-    def progress_callback(workflow_state):
-        """Callback to capture progress updates."""
-        progress_info = {
-            "status": workflow_state.status,
-            "current_agent": workflow_state.current_agent,
-            "completed_agents": workflow_state.completed_agents.copy(),
-            "progress_percentage": workflow_state.get_progress_percentage(
-                2
-            ),  # 2 agents total
-        }
-        progress_updates.append(progress_info)
-        logger.info(f"Progress update: {progress_info}")
+    logger.info("Total progress updates: %d", len(progress_updates))
+    for i, update in enumerate(progress_updates):
+        logger.debug("Update %d: %s", i + 1, update)
+
+    assert len(progress_updates) > 0, "Progress callback was not called"
+    assert executed_workflow["completed_agents"] == [
+        "ProjectPlanningAgent",
+        "ModuleDesignAgent",
+    ]
+    assert progress_updates[-1]["progress_percentage"] == 100.0
+
+
+def test_workflow_streaming(make_coordinator):
+    """Test that agent outputs are streamed as each agent completes."""
+    logger.info("Testing workflow streaming")
 
     # Use a new coordinator for this test to ensure isolation
-    coordinator = MultiAgentCoordinator()
+    coordinator = make_coordinator()
     setup_workflow(coordinator)
-    coordinator.add_progress_callback(progress_callback)
 
-    # Execute workflow
-    coordinator.execute_workflow("Test progress monitoring")
+    stream = coordinator.execute_workflow_stream("Test workflow streaming")
 
-    logger.info(f"Total progress updates: {len(progress_updates)}")
-    for i, update in enumerate(progress_updates):
-        logger.info(f"Update {i + 1}: {update}")
+    # The first agent's output is available before the workflow finishes
+    agent_name, output = next(stream)
+    assert agent_name == "ProjectPlanningAgent"
+    assert output["project_name"] == "Test Project"
 
-    assert len(progress_updates) > 0, "Progress callback was not called"
+    # Streamed outputs are copies; mutating one leaves the stored data alone
+    output["project_name"] = "MUTATED"
+    stored = coordinator.data_store.get_latest_agent_output("ProjectPlanningAgent")
+    assert stored.data["project_name"] == "Test Project"
+    assert MOCK_PROJECT_PLAN["project_name"] == "Test Project"
+
+    agent_name, output = next(stream)
+    assert agent_name == "ModuleDesignAgent"
+    assert len(output["modules"]) == 2
+
+    try:
+        next(stream)
+    except StopIteration as stop:
+        result = stop.value
+    else:
+        raise AssertionError("Stream yielded more outputs than registered agents")
+
+    assert result.success, f"Workflow failed: {result.error_message}"
+    assert result.completed_agents == ["ProjectPlanningAgent", "ModuleDesignAgent"]
+
+
+def test_remove_progress_callback(make_coordinator):
+    """Test that a progress callback can unsubscribe itself."""
+    coordinator = make_coordinator()
+    setup_workflow(coordinator)
+    calls = []
+
+    def one_shot_callback(workflow_state):
+        calls.append(workflow_state.status)
+        assert coordinator.remove_progress_callback(one_shot_callback)
+
+    coordinator.add_progress_callback(one_shot_callback)
+    result = coordinator.execute_workflow("Create a simple Python project")
+
+    assert result.success, f"Workflow failed: {result.error_message}"
+    assert len(calls) == 1
+    assert not coordinator.remove_progress_callback(one_shot_callback)
+
+
+def test_workflow_stream_closed_early(make_coordinator):
+    """Test that abandoning a workflow stream cancels the workflow."""
+    coordinator = make_coordinator()
+    setup_workflow(coordinator)
+    statuses = []
+    coordinator.add_progress_callback(lambda state: statuses.append(state.status))
+
+    stream = coordinator.execute_workflow_stream("Test closing the stream")
+    agent_name, _ = next(stream)
+    assert agent_name == "ProjectPlanningAgent"
+    stream.close()
+
+    # The cancellation is reported once, as the final progress update
+    assert statuses.count(WorkflowStatus.CANCELLED) == 1
+    assert statuses[-1] == WorkflowStatus.CANCELLED
+
+    workflow_state = coordinator.data_store.get_project_context().workflow_state
+    assert workflow_state.status == WorkflowStatus.CANCELLED
+    assert workflow_state.end_time is not None
+    assert coordinator.get_workflow_progress() is None
+
+
+def test_root_agent_execute_stream(make_coordinator):
+    """Test that the root agent streams partial results and a final summary."""
+    coordinator = make_coordinator()
+    setup_workflow(coordinator)
+    root_agent = RootAgent(coordinator=coordinator)
+
+    entries = list(
+        root_agent.execute_stream({"description": "Create a simple Python project"})
+    )
+
+    assert [entry["stage"] for entry in entries] == [
+        "ProjectPlanningAgent",
+        "ModuleDesignAgent",
+        "final",
+    ]
+    assert entries[0]["partial"]["project_name"] == "Test Project"
+
+    final = entries[-1]
+    assert final["success"], f"Workflow failed: {final['error_message']}"
+    assert final["completed_agents"] == ["ProjectPlanningAgent", "ModuleDesignAgent"]
+    assert {"project_plan", "module_structure"} <= set(final["deliverables"])
+    assert final["summary"]["successful_agents"] == 2
+
+    # A missing description is rejected before any agent runs
+    with pytest.raises(AgentExecutionError):
+        list(root_agent.execute_stream({"description": ""}))
+
+
+class CountingPlanningAgent(MockProjectPlanningAgent):
+    """Mock planning agent that counts how often it really executes."""
+
+    def __init__(self):
+        super().__init__()
+        self._execution_count = 0
+
+    def execute(self, input_data):
+        self._execution_count += 1
+        return super().execute(input_data)
+
+
+def test_cached_agent_executes_once_across_workflows(make_coordinator):
+    """Test that a cacheable agent reuses its output across workflow runs."""
+    planning_agent = CountingPlanningAgent()
+
+    coordinator = make_coordinator()
+    coordinator.register_agent(planning_agent, dependencies=[])
+    first = coordinator.execute_workflow("Create a simple Python project")
+
+    # Rerun on a fresh data store; only timestamps and workflow state differ
+    coordinator.data_store.clear_data()
+    second = coordinator.execute_workflow("Create a simple Python project")
+
+    # A new coordinator builds the same input for the shared agent
+    other_coordinator = make_coordinator()
+    other_coordinator.register_agent(planning_agent, dependencies=[])
+    third = other_coordinator.execute_workflow("Create a simple Python project")
+
+    assert first.success and second.success and third.success
+    assert planning_agent._execution_count == 1
+    assert len(planning_agent._execute_cache) == 1
+
+
+def test_register_agents_is_atomic(make_coordinator):
+    """Test that a duplicate name leaves no agents from the batch registered."""
+    coordinator = make_coordinator()
+    coordinator.register_agent(MockModuleDesignAgent(), dependencies=[])
+
+    with pytest.raises(ValueError, match="already registered"):
+        coordinator.register_agents(
+            [
+                (MockProjectPlanningAgent(), []),
+                (MockModuleDesignAgent(), ["ProjectPlanningAgent"]),
+            ]
+        )
+    assert coordinator.registry.list_agents() == ["ModuleDesignAgent"]
+
+    with pytest.raises(ValueError, match="already registered"):
+        coordinator.register_agents(
+            [(MockProjectPlanningAgent(), []), (MockProjectPlanningAgent(), [])]
+        )
+    assert coordinator.registry.list_agents() == ["ModuleDesignAgent"]
+
+
+def test_execution_order_cache_invalidation():
+    """Test that the cached execution order follows registry changes."""
+    registry = AgentRegistry()
+    design_dependencies = ["ProjectPlanningAgent"]
+    registry.register_agent(MockModuleDesignAgent(), dependencies=design_dependencies)
+    registry.register_agent(MockProjectPlanningAgent(), dependencies=[])
+
+    # The registry keeps its own copy of the dependency list
+    design_dependencies.append("MissingAgent")
+    assert registry.get_agent_dependencies("ModuleDesignAgent") == [
+        "ProjectPlanningAgent"
+    ]
+
+    execution_order = registry.get_execution_order()
+    assert execution_order == ["ProjectPlanningAgent", "ModuleDesignAgent"]
+
+    # Mutating the returned list must not corrupt the cached order
+    execution_order.clear()
+    assert registry.get_execution_order() == [
+        "ProjectPlanningAgent",
+        "ModuleDesignAgent",
+    ]
+
+    assert registry.get_execution_levels() == [
+        ["ProjectPlanningAgent"],
+        ["ModuleDesignAgent"],
+    ]
+
+    registry.unregister_agent("ModuleDesignAgent")
+    assert registry.get_execution_order() == ["ProjectPlanningAgent"]
+    assert registry.get_execution_levels() == [["ProjectPlanningAgent"]]
+
+    registry.clear_agents()
+    assert registry.get_execution_order() == []
+    assert registry.get_execution_levels() == []
+
+    # Levels list agents in registration order, not dependency discovery order
+    for name, dependencies in [("A", []), ("B", []), ("C", ["B"]), ("D", ["A"])]:
+        registry.register_agent(
+            FailureAgent(name, f"Agent {name}", "Unused", "Unused"),
+            dependencies=dependencies,
+        )
+    assert registry.get_execution_order() == ["A", "B", "C", "D"]
+    assert registry.get_execution_levels() == [["A", "B"], ["C", "D"]]
@@ -1,40 +1,52 @@
 #!/usr/bin/env python3
 """Integration test showing workflow execution with error recovery."""
 
-import sys
+import asyncio
 import logging
-from typing import Dict, Any
-
-# Add the project root to Python path
-sys.path.insert(0, ".")
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 
 from multi_agent_system.core import (
     BaseMultiAgent,
-    MultiAgentCoordinator,
     AgentExecutionError,
 )
-from multi_agent_system.core.agent_registry import AgentRegistry
-from multi_agent_system.core.data_store import SharedDataStore
+from multi_agent_system.core.models import WorkflowStatus
+
+from _mocks import FailureAgent
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Keep only the most recent recovery events in long workflows
+MAX_RECOVERY_EVENTS = 128
+
+
+@dataclass(frozen=True, slots=True)
+class RecoveryEvent:
+    """Workflow state captured when the set of failed agents changes."""
+
+    failed_agents: Tuple[str, ...]
+    status: WorkflowStatus
+    current_agent: Optional[str]
+
 
 class ReliableAgent(BaseMultiAgent):
     """Mock agent that always succeeds."""
 
+    # Output depends only on the agent name, so repeated runs can reuse it
+    cacheable = True
+
     def __init__(self, name: str):
         super().__init__(
             name=name,
             description=f"Reliable agent {name}",
             instruction="Always succeed",
         )
+        self._execution_count = 0
 
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        logger.info(f"Executing {self.agent_name} - success")
+        self._execution_count += 1
+        logger.info("Executing %s - success", self.agent_name)
         return {"status": "success", "agent": self.agent_name}
 
     def validate_input(self, input_data: Dict[str, Any]) -> bool:
@@ -47,6 +59,9 @@ class ReliableAgent(BaseMultiAgent):
 class RecoverableAgent(BaseMultiAgent):
     """Mock agent that fails first time but can be skipped."""
 
+    # The failure is deterministic, so retrying only adds delay
+    max_attempts = 1
+
     def __init__(self):
         super().__init__(
             name="CodeRefinementAgent",  # Optional agent
@@ -55,17 +70,9 @@ class RecoverableAgent(BaseMultiAgent):
         )
         self._attempt_count = 0
 
-    @property
-    def attempt_count(self):
-        return self._attempt_count
-
-    @attempt_count.setter
-    def attempt_count(self, value):
-        self._attempt_count = value
-
     def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        self.attempt_count += 1
-        logger.info(f"Executing {self.agent_name} - attempt {self.attempt_count}")
+        self._attempt_count += 1
+        logger.info("Executing %s - attempt %d", self.agent_name, self._attempt_count)
 
         # Always fail to test recovery
         raise AgentExecutionError(
@@ -79,42 +86,58 @@ class RecoverableAgent(BaseMultiAgent):
         return result
 
 
-def test_workflow_with_recovery():
+def register_recovery_agents(coordinator) -> Dict[str, BaseMultiAgent]:
+    """Register the recovery workflow agents and return them by name."""
+    agents = [
+        (ReliableAgent("ProjectPlanningAgent"), []),
+        (ReliableAgent("ModuleDesignAgent"), ["ProjectPlanningAgent"]),
+        # This will fail but can be skipped
+        (RecoverableAgent(), ["ModuleDesignAgent"]),
+        (ReliableAgent("CodeImplementationAgent"), ["CodeRefinementAgent"]),
+    ]
+    coordinator.register_agents(agents)
+    logger.info("Registered agents for workflow with recovery test")
+    return {agent.agent_name: agent for agent, _ in agents}
+
+
+def test_workflow_with_recovery(make_coordinator):
     """Test a complete workflow with error recovery."""
     logger.info("Testing workflow execution with error recovery")
 
     # Create a new coordinator with its own registry and data store for isolation
-    registry = AgentRegistry()
-    data_store = SharedDataStore()
-    coordinator = MultiAgentCoordinator(registry=registry, data_store=data_store)
-
-    # Create agents
-    planning_agent = ReliableAgent("ProjectPlanningAgent")
-    design_agent = ReliableAgent("ModuleDesignAgent")
-    recoverable_agent = RecoverableAgent()  # This will fail but can be skipped
-    implementation_agent = ReliableAgent("CodeImplementationAgent")
-
-    # Register agents with dependencies
-    coordinator.register_agent(planning_agent, dependencies=[])
-    coordinator.register_agent(design_agent, dependencies=["ProjectPlanningAgent"])
-    coordinator.register_agent(recoverable_agent, dependencies=["ModuleDesignAgent"])
-    coordinator.register_agent(
-        implementation_agent, dependencies=["CodeRefinementAgent"]
-    )
-
-    logger.info("Registered agents for workflow with recovery test")
+    coordinator = make_coordinator(retry_delay=0.1)
+    agents = register_recovery_agents(coordinator)
+    recoverable_agent = agents["CodeRefinementAgent"]
+
+    assert coordinator.get_agent_execution_levels() == [
+        ["ProjectPlanningAgent"],
+        ["ModuleDesignAgent"],
+        ["CodeRefinementAgent"],
+        ["CodeImplementationAgent"],
+    ]
 
     # Add progress callback to monitor recovery
-    recovery_events = []
+    recovery_events = deque(maxlen=MAX_RECOVERY_EVENTS)
+    last_failed_agents: Tuple[str, ...] = ()
 
     def progress_callback(workflow_state):
-        if workflow_state.failed_agents:
+        nonlocal last_failed_agents
+        # Only record an event when the set of failed agents changes; compare
+        # lengths first so unchanged ticks build no tuple
+        current = workflow_state.failed_agents
+        if len(current) == len(last_failed_agents) and all(
+            name == last for name, last in zip(current, last_failed_agents)
+        ):
+            return
+        failed_agents = tuple(current)
+        last_failed_agents = failed_agents
+        if failed_agents:
             recovery_events.append(
-                {
-                    "failed_agents": workflow_state.failed_agents.copy(),
-                    "status": workflow_state.status,
-                    "current_agent": workflow_state.current_agent,
-                }
+                RecoveryEvent(
+                    failed_agents=failed_agents,
+                    status=workflow_state.status,
+                    current_agent=workflow_state.current_agent,
+                )
             )
 
     coordinator.add_progress_callback(progress_callback)
@@ -123,7 +146,8 @@ def test_workflow_with_recovery():
     logger.info("Starting workflow execution with expected recovery")
     result = coordinator.execute_workflow("Test project with recoverable failure")
 
-    logger.info(f"Workflow result: {result.to_dict()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Workflow result: %s", result.to_dict())
 
     # Check results
     assert result.success, (
@@ -135,6 +159,12 @@ def test_workflow_with_recovery():
     assert "CodeRefinementAgent" in result.failed_agents, (
         "Expected recoverable agent to fail"
     )
+    # max_attempts caps the coordinator's retries for the deterministic failure
+    assert recoverable_agent._attempt_count == 1
+    workflow_state = coordinator.data_store.get_project_context().workflow_state
+    assert workflow_state.error_message == (
+        "Agent CodeRefinementAgent failed after 1 attempts"
+    )
     logger.info("✓ Recoverable agent correctly failed and was handled")
 
     # Check that other agents completed
@@ -143,55 +173,75 @@ def test_workflow_with_recovery():
         "ModuleDesignAgent",
         "CodeImplementationAgent",
     ]
+    completed_agents = frozenset(result.completed_agents)
     for agent_name in expected_completed:
-        assert agent_name in result.completed_agents, (
+        assert agent_name in completed_agents, (
             f"{agent_name} should have completed"
         )
-        logger.info(f"✓ {agent_name} completed successfully")
+    logger.info("✓ Agents completed successfully: %s", expected_completed)
 
     # Check recovery events
     assert recovery_events, "No recovery events were captured"
-    logger.info(f"✓ Recovery events captured: {len(recovery_events)}")
-    for event in recovery_events:
-        logger.info(f"  Recovery event: {event}")
+    assert recovery_events[0].failed_agents == ("CodeRefinementAgent",)
+    logger.info("✓ Recovery events captured: %d", len(recovery_events))
+    if logger.isEnabledFor(logging.INFO):
+        for event in recovery_events:
+            logger.info("  Recovery event: %s", event)
 
 
-def test_user_intervention_workflow():
-    """Test workflow that requires user intervention."""
-    logger.info("Testing workflow with user intervention requirement")
+def test_async_workflow_with_recovery(make_coordinator):
+    """Test that the async entry point recovers the same way."""
+    coordinator = make_coordinator(retry_delay=0.1)
+    register_recovery_agents(coordinator)
 
-    # Create coordinator with separate registry
-    from multi_agent_system.core.agent_registry import AgentRegistry
-    from multi_agent_system.core.data_store import SharedDataStore
+    result = asyncio.run(
+        coordinator.execute_workflow_async("Test project with recoverable failure")
+    )
 
-    intervention_registry = AgentRegistry()
-    intervention_data_store = SharedDataStore()
-    coordinator = MultiAgentCoordinator(
-        registry=intervention_registry, data_store=intervention_data_store
+    assert result.success, (
+        f"Async workflow should have succeeded with recovery: {result.error_message}"
     )
+    assert result.failed_agents == ["CodeRefinementAgent"]
+    assert result.completed_agents == [
+        "ProjectPlanningAgent",
+        "ModuleDesignAgent",
+        "CodeImplementationAgent",
+    ]
+    logger.info("✓ Async workflow execution recovered as expected")
 
-    # Create a critical failing agent
-    class CriticalFailingAgent(BaseMultiAgent):
-        def __init__(self):
-            super().__init__(
-                name="ProjectPlanningAgent",  # Critical agent
-                description="Critical agent that requires intervention",
-                instruction="Fail critically",
-            )
 
-        def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
-            raise AgentExecutionError(
-                "ProjectPlanningAgent",
-                "Critical configuration error - manual setup required",
-            )
+def test_recovery_workflow_reuses_cached_outputs(make_coordinator):
+    """Test that cacheable agents are not executed again on a rerun."""
+    coordinator = make_coordinator(retry_delay=0.1)
+    agents = register_recovery_agents(coordinator)
 
-        def validate_input(self, input_data: Dict[str, Any]) -> bool:
-            return True
+    coordinator.execute_workflow("Test project with recoverable failure")
+    # Start from a fresh data store so the agents see the same input again
+    coordinator.data_store.clear_data()
+    coordinator.execute_workflow("Test project with recoverable failure")
 
-        def format_output(self, result: Any) -> Dict[str, Any]:
-            return result
+    # The implementation agent's input carries a freshly stamped module
+    # structure, so only the planning and design agents hit the cache
+    for agent_name in ("ProjectPlanningAgent", "ModuleDesignAgent"):
+        assert agents[agent_name]._execution_count == 1, (
+            f"{agent_name} executed again"
+        )
+
+
+def test_user_intervention_workflow(make_coordinator):
+    """Test workflow that requires user intervention."""
+    logger.info("Testing workflow with user intervention requirement")
 
-    critical_agent = CriticalFailingAgent()
+    # Create coordinator with separate registry
+    coordinator = make_coordinator()
+
+    # Create a critical failing agent
+    critical_agent = FailureAgent(
+        "ProjectPlanningAgent",  # Critical agent
+        "Critical agent that requires intervention",
+        "Fail critically",
+        "Critical configuration error - manual setup required",
+    )
     coordinator.register_agent(critical_agent, dependencies=[])
 
     # Execute workflow (should fail and require intervention)
@@ -205,11 +255,14 @@ def test_user_intervention_workflow():
     intervention_requests = coordinator.get_user_intervention_requests()
     assert intervention_requests, "No user intervention request was created"
     logger.info(
-        f"✓ User intervention request created: {len(intervention_requests)} requests"
+        "✓ User intervention request created: %d requests", len(intervention_requests)
     )
 
     # Show intervention details
-    for request in intervention_requests:
-        logger.info(f"  Intervention for: {request.get('agent_name')}")
-        logger.info(f"  Error: {request.get('error_message')}")
-        logger.info(f"  Suggested actions: {request.get('suggested_actions', [])}")
+    if logger.isEnabledFor(logging.INFO):
+        for request in intervention_requests:
+            logger.info("  Intervention for: %s", request.get("agent_name"))
+            logger.info("  Error: %s", request.get("error_message"))
+            logger.info(
+                "  Suggested actions: %s", request.get("suggested_actions", [])
+            )